@@ -44,13 +44,13 @@ print("First mutable site: ",mutable_structure.properties.sites[0].dict())
 structure.to_dict()
 
 # %% [markdown]
-# We can see that some properties are generated automatically, like *kinds*, *charges*, *dimensionality* and so on, and some other properties are set by default if not provided, e.g. the *kind_name* of each site.
+# We can see that some properties are generated automatically, like *formula*, *cell_volume* and *dimensionality*, and some other properties are set by default if not provided, e.g. the *kind_name* of each site.
 #
 # :::{note}
 # :class: dropdown
 # To visualize the full list of properties, use the `get_property_names` method of the structure classes.
 #
-# The `to_dict` method is nothing else than a wrapper for the *BaseModel* `model_dump` method of the *properties* attribute.
+# The `to_dict` method is a wrapper for the *BaseModel* `model_dump` method of the *properties* attribute. By default it leaves out the per-site computed properties (*charges*, *magmoms*, *masses*, *kinds*, *symbols* and *positions*), which only collect the values already contained in the sites: use `to_dict(include_derived=True)` to include them as well.
 # :::
 #
 # ### Initialization from ASE or Pymatgen
@@ -1,11 +1,15 @@
 import copy
+import io
 import json
 import typing as t
+from itertools import product
 import numpy as np
 
 from aiida import orm
 from aiida.common.constants import elements
+from aiida.common.exceptions import ValidationError
 
+from aiida_atomistic.data.structure.models import _PER_SITE_COMPUTED_FIELDS
 from aiida_atomistic.data.structure.site import SiteMutable as Site
 
 try:
@@ -21,6 +25,7 @@ except ImportError:
 
 try:
     import pymatgen.core as core  # noqa: F401
+    from pymatgen.io.cif import CifWriter
 
     has_pymatgen = True
     PYMATGEN_MOLECULE = core.structure.Molecule
@@ -38,7 +43,10 @@ from aiida_atomistic.data.structure.utils import (
     atom_kinds_to_html,
     calc_cell_volume,
     create_automatic_kind_name,
+    get_dimensionality,
+    atomic_numbers_for,
     get_formula,
+    get_symbols_string,
 )
 
 _MASS_THRESHOLD = 1.0e-3
@@ -49,7 +57,6 @@ _DEFAULT_CELL = ((0, 0, 0),) * 3
 
 _valid_symbols = tuple(i["symbol"] for i in elements.values())
 _atomic_masses = {el["symbol"]: el["mass"] for el in elements.values()}
-_atomic_numbers = {data["symbol"]: num for num, data in elements.items()}
 
 _default_values = {
     "charges": 0,
@@ -60,11 +67,27 @@ class GetterMixin:
 
     @property
     def is_alloy(self):
-        return any(_.is_alloy for _ in self.properties.sites)
+        counts, _ = self._get_weights_summary()
+        return bool((counts != 1).any())
 
     @property
     def has_vacancies(self):
-        return any(_.has_vacancies for _ in self.properties.sites)
+        _, sums = self._get_weights_summary()
+        return bool((1.0 - sums >= _SUM_THRESHOLD).any())
+
+    def _get_weights_summary(self):
+        """Return the number of elements and the sum of the weights of each site.
+
+        :return: a tuple of two numpy arrays with length equal to the number of sites.
+        """
+        weights = self.get_site_property("weights")
+        if weights.ndim == 2:
+            # all the sites have the same number of elements
+            return np.full(len(weights), weights.shape[1]), weights.sum(axis=1)
+        return (
+            np.fromiter(map(len, weights), dtype=int, count=len(weights)),
+            np.fromiter(map(sum, weights), dtype=float, count=len(weights)),
+        )
 
     @classmethod
     def from_ase(
@@ -81,20 +104,37 @@ class GetterMixin:
         data["cell"] = aseatoms.cell.array.tolist()
         data["pbc"] = aseatoms.pbc.tolist()
 
-        data["sites"] = []
-        # self.clear_kinds()  # This also calls clear_sites
-        for atom in aseatoms:
-            new_site = Site.atom_to_site(aseatom=atom)
-            data["sites"].append(new_site.model_dump())
-
-        structure = cls(**data)
+        # Read all the per-atom arrays at once, instead of going through the ase.Atom of each site.
+        symbols = aseatoms.get_chemical_symbols()
+        magmoms = aseatoms.get_initial_magnetic_moments()
+        if magmoms.ndim == 1:
+            # collinear magnetic moments are taken along x, as in `Site.atom_to_site`
+            magmoms = np.column_stack([magmoms, np.zeros((len(magmoms), 2))])
+
+        data["sites"] = [
+            {
+                "symbol": symbol,
+                "kind_name": f"{symbol}{tag}",
+                "position": position,
+                "mass": mass,
+                "charge": charge,
+                "magmom": magmom,
+                "weights": (1.0,),
+            }
+            for symbol, tag, position, mass, charge, magmom in zip(
+                symbols,
+                aseatoms.get_tags().tolist(),
+                aseatoms.get_positions().tolist(),
+                aseatoms.get_masses().tolist(),
+                aseatoms.get_initial_charges().tolist(),
+                magmoms.tolist(),
+            )
+        ]
 
         if detect_kinds:
-            data["sites"] = structure.get_kinds(ready_to_use=True)
+            data["sites"] = cls(**data).get_kinds(ready_to_use=True)
 
-        structure = cls(**data)
-
-        return structure
+        return cls(**data)
 
     @classmethod
     def from_file(
@@ -146,19 +186,10 @@ class GetterMixin:
         .. note:: Requires the pymatgen module (version >= 3.0.13, usage
             of earlier versions may cause errors).
         """
-        box = [
-            max(x.coords.tolist()[0] for x in mol.properties.sites)
-            - min(x.coords.tolist()[0] for x in mol.properties.sites)
-            + 2 * margin,
-            max(x.coords.tolist()[1] for x in mol.properties.sites)
-            - min(x.coords.tolist()[1] for x in mol.properties.sites)
-            + 2 * margin,
-            max(x.coords.tolist()[2] for x in mol.properties.sites)
-            - min(x.coords.tolist()[2] for x in mol.properties.sites)
-            + 2 * margin,
-        ]
-        structure = cls._from_pymatgen_structure(mol.get_boxed_structure(*box), detect_kinds=detect_kinds)
-        structure.properties.pbc = [False, False, False]
+        box = (np.ptp(mol.cart_coords, axis=0) + 2 * margin).tolist()
+        structure = cls._from_pymatgen_structure(
+            mol.get_boxed_structure(*box), detect_kinds=detect_kinds, pbc=[False, False, False]
+        )
 
         return structure
 
@@ -167,10 +198,13 @@ class GetterMixin:
         cls,
         struct: PYMATGEN_STRUCTURE,
         detect_kinds: bool = False,
+        pbc=None,
         ):
         """Load the structure from a pymatgen Structure object.
 
-        .. note:: periodic boundary conditions are set to True in all
+        :param pbc: the periodic boundary conditions of the structure.
+
+        .. note:: if not provided, periodic boundary conditions are set to True in all
             three directions.
         .. note:: Requires the pymatgen module (version >= 3.3.5, usage
             of earlier versions may cause errors).
@@ -232,7 +266,7 @@ class GetterMixin:
 
         inputs = {}
         inputs["cell"] = struct.lattice.matrix.tolist()
-        inputs["pbc"] = [True, True, True]
+        inputs["pbc"] = [True, True, True] if pbc is None else pbc
         # self.clear_kinds()
 
         inputs["sites"] = []
@@ -257,28 +291,34 @@ class GetterMixin:
 
             inputs["sites"].append(site_info)
 
-        structure = cls(**inputs)
-
         if detect_kinds:
-                inputs["sites"] = structure.get_kinds(ready_to_use=True)
+            inputs["sites"] = cls(**inputs).get_kinds(ready_to_use=True)
 
-        structure = cls(**inputs)
-
-        return structure
+        return cls(**inputs)
 
     def to_dict(
             self,
-            detect_kinds: bool = False
+            detect_kinds: bool = False,
+            include_derived: bool = False,
         ):
             """
             Convert the structure to a dictionary representation.
 
             :param detect_kinds: Whether to detect and include the kinds of the structure.
             :type detect_kinds: bool, optional
+            :param include_derived: Whether to include the per-site computed properties (charges, magmoms, masses,
+                kinds, symbols, positions), which duplicate the content of the sites and are not computed otherwise.
+            :type include_derived: bool, optional
             :return: The structure as a dictionary.
             :rtype: dict
             """
-            dict_repr = copy.deepcopy(self.properties.model_dump())
+            # model_dump already builds new containers, no need to copy them again,
+            # apart from the custom values, which may be arbitrary (e.g. numpy arrays) and are not copied by it.
+            dict_repr = self.properties.model_dump(
+                exclude=None if include_derived else set(_PER_SITE_COMPUTED_FIELDS)
+            )
+            if dict_repr.get("custom") is not None:
+                dict_repr["custom"] = copy.deepcopy(dict_repr["custom"])
 
             if detect_kinds:
                 dict_repr["sites"] = self.get_kinds(ready_to_use=True)
@@ -291,9 +331,9 @@ class GetterMixin:
         """Return a list with length equal to the number of sites of this structure,
         where each element of the list is the property of the corresponding site.
 
-        :return: a list of floats
+        :return: a numpy array (read-only for immutable structures)
         """
-        return np.array([getattr(this_site, property_name) for this_site in self.properties.sites])
+        return self.properties.get_site_arrays([property_name])[property_name]
 
     def get_property_names(self, domain=None):
         """get a list of properties
@@ -325,7 +365,39 @@ class GetterMixin:
 
         :return: a float.
         """
-        return calc_cell_volume(self.properties.cell)
+        return calc_cell_volume(self.properties.get_cell_array())
+
+    def get_cell_lengths(self):
+        """Returns the lengths of the three cell vectors in Angstrom.
+
+        :return: a list of three floats.
+        """
+        lengths, _ = self._get_cell_metrics()
+        return lengths.tolist()
+
+    def get_cell_angles(self):
+        """Returns the angles alpha, beta and gamma between the cell vectors in degrees.
+
+        :return: a list of three floats.
+        """
+        _, angles = self._get_cell_metrics()
+        return angles.tolist()
+
+    def _get_cell_metrics(self):
+        """Compute the cell lengths and angles from the metric tensor ``cell @ cell.T``.
+
+        The lengths are the square roots of its diagonal, the cosines of the angles
+        are its off-diagonal elements (23, 13, 12) normalized by the lengths.
+
+        :return: a tuple of two numpy arrays: the lengths (Angstrom) and the angles (degrees).
+        """
+        cell = self.properties.get_cell_array()
+        metric = cell @ cell.T
+        lengths = np.sqrt(np.diag(metric))
+        first, second = [1, 0, 0], [2, 2, 1]
+        cosines = metric[first, second] / (lengths[first] * lengths[second])
+        angles = np.degrees(np.arccos(np.clip(cosines, -1.0, 1.0)))
+        return lengths, angles
 
     def get_cif(self, converter="ase", store=False, **kwargs):
         """Creates :py:class:`aiida.orm.nodes.data.cif.CifData`.
@@ -402,7 +474,7 @@ class GetterMixin:
             initial order in which the atoms were appended by the user is
             used to group and/or order the symbols in the formula
         """
-        symbol_list = [s.symbol for s in self.properties.sites]
+        symbol_list = self.get_site_property("symbol")
 
         return get_formula(symbol_list, mode=mode, separator=separator)
 
@@ -420,27 +492,25 @@ class GetterMixin:
 
         :returns: a dictionary with the composition
         """
-        import numpy as np
+        if self.is_alloy or self.has_vacancies:
+            symbols = [
+                get_symbols_string(site.alloy_list, site.weights) for site in self.properties.sites
+            ]
+        else:
+            symbols = self.get_site_property("symbol")
 
-        symbols_list = [
-            self.get_kind(s.kind_name).get_symbols_string() for s in self.properties.sites
-        ]
-        symbols_set = set(symbols_list)
+        unique_symbols, counts = np.unique(symbols, return_counts=True)
+        unique_symbols = unique_symbols.tolist()
 
         if mode == "full":
-            return {symbol: symbols_list.count(symbol) for symbol in symbols_set}
+            return dict(zip(unique_symbols, counts.tolist()))
 
         if mode == "reduced":
-            gcd = np.gcd.reduce([symbols_list.count(symbol) for symbol in symbols_set])
-            return {
-                symbol: (symbols_list.count(symbol) / gcd) for symbol in symbols_set
-            }
+            gcd = np.gcd.reduce(counts)
+            return dict(zip(unique_symbols, (counts / gcd).tolist()))
 
         if mode == "fractional":
-            sum_comp = sum(symbols_list.count(symbol) for symbol in symbols_set)
-            return {
-                symbol: symbols_list.count(symbol) / sum_comp for symbol in symbols_set
-            }
+            return dict(zip(unique_symbols, (counts / counts.sum()).tolist()))
 
         raise ValueError(
             f"mode `{mode}` is invalid, choose from `full`, `reduced` or `fractional`."
@@ -467,8 +537,8 @@ class GetterMixin:
         ```
 
         In Step 2 it checks for the matrix which rows have the same numbers in the same order, i.e. recognize the different
-        kinds considering all the properties. This is done by subtracting a row from the others and see if all the elements
-        are zero, meaning that we have the same combination of kinds.
+        kinds considering all the properties. This is done by grouping the identical rows with `np.unique(k, axis=0)`,
+        and numbering the resulting kinds in order of appearance.
 
         In Step 3 we override the kinds with the kind_tags.
 
@@ -522,60 +592,48 @@ class GetterMixin:
         # Step 1:
         kind_properties = []
         kinds_dictionary = {"kind_name": {}}
-        for single_property in self.properties.sites[0].model_dump().keys():
-            if single_property not in ["symbol", "position", "kind_name",] + exclude:
-                # prop = self.get_site_property(single_property)
-                thr = custom_thr.get(
-                    single_property, default_thresholds.get(single_property)
-                )
-                kinds_dictionary[single_property] = {}
+        skip = frozenset(("symbol", "position", "kind_name", *exclude))
+        for single_property in tuple(p for p in Site.model_fields if p not in skip):
+            thr = custom_thr.get(
+                single_property, default_thresholds.get(single_property)
+            )
 
-                kinds_per_property = self._to_kinds(
-                    property_name=single_property, symbols=symbols, thr=thr
-                )
-                kind_properties.append(kinds_per_property[0])
-                # I prefer to store again under the key 'value', may be useful in the future
-                kinds_dictionary[single_property] = kinds_per_property[1]
+            kinds_per_property = self._to_kinds(
+                property_name=single_property, symbols=symbols, thr=thr
+            )
+            kind_properties.append(kinds_per_property[0])
+            # I prefer to store again under the key 'value', may be useful in the future
+            kinds_dictionary[single_property] = kinds_per_property[1]
 
-        k = np.array(kind_properties)
+        k = np.array(kind_properties, dtype=int).reshape(len(kind_properties), len(symbols))
         k = k.T
 
         # Step 2:
-        kinds = np.zeros(len(self.get_site_property("symbol")), dtype=int) - 1
-        check_array = np.zeros(len(self.get_site_property("position")), dtype=int)
-        kind_names = symbols.tolist()
-        kind_numeration = []
-        for i in range(len(k)):
-            # Goes from the first symbol... so the numbers will be from zero to N (Please note: the symbol does not matter: Li0, Cu1... not Li0, Cu0.)
-            element = symbols[i]
-            diff = k - k[i]
-            diff_sum = np.sum(np.abs(diff), axis=1)
-
-            kinds[np.where(diff_sum == 0)[0]] = i
-            for where in np.where(diff_sum == 0)[0]:
-                if (
-                    f"{element}{i}" in kind_tags
-                ):  # If I encounter the same tag as provided as input or generated here:
-                    kind_numeration.append(i + len(k))
-                else:
-                    kind_numeration.append(i)
-
-                kind_names[where] = f"{element}{kind_numeration[-1]}"
-
-                check_array[where] = i
-                #print(f"site {where} is {element}{kind_numeration[-1]}")
-
-            if len(np.where(kinds == -1)[0]) == 0:
-                #print(f"search ended at iteration {i}")
-                break
+        # Sites with identical rows of k are of the same kind. The kinds are numbered in order of appearance,
+        # so the numbers go from zero to N (Please note: the symbol does not matter: Li0, Cu1... not Li0, Cu0.)
+        _, first_sites, kinds = np.unique(k, axis=0, return_index=True, return_inverse=True)
+        kinds = kinds.reshape(-1)
+        order_of_appearance = np.argsort(first_sites)
+        kind_ranks = np.empty_like(order_of_appearance)
+        kind_ranks[order_of_appearance] = np.arange(len(order_of_appearance))
+
+        # for each site, the index of the first site of the same kind
+        check_array = first_sites[kinds]
+        kinds = kind_ranks[kinds]
+
+        # If I encounter the same tag as provided as input, the kind is shifted by the number of sites.
+        symbols = symbols.astype(str)
+        defined_tags = [tag for tag in kind_tags if tag]
+        collisions = np.isin(np.char.add(symbols, kinds.astype(str)), defined_tags)
+        kind_numeration = np.where(collisions, kinds + len(k), kinds)
+        kind_names = np.char.add(symbols, kind_numeration.astype(str))
 
         # Step 3:
-        kinds_dictionary["kind_name"] = [
-            kind_names[i]  if not kind_tags[i] else kind_tags[i]
-            for i in range(len(kind_tags))
-        ]
+        kinds_dictionary["kind_name"] = np.where(
+            [bool(tag) for tag in kind_tags], np.array(kind_tags, dtype=object), kind_names
+        ).tolist()
 
-        kinds_dictionary["index"] = kind_numeration
+        kinds_dictionary["index"] = kind_numeration.tolist()
         kinds_dictionary["symbol"] = symbols.tolist()
         kinds_dictionary["position"] = self.get_site_property("position").tolist()
 
@@ -586,16 +644,13 @@ class GetterMixin:
             )
 
         if ready_to_use:
-            new_sites = []
-            for index_kind in kinds_dictionary["index"]:
-                dict_site = {}
-                for k,v in kinds_dictionary.items():
-                    if k not in ["symbol","position","index"]:
-                        dict_site[k] = v[index_kind].tolist() if isinstance(v[index_kind], np.ndarray) else v[index_kind]
-                for value in ["symbol","position"]:
-                    dict_site[value] = kinds_dictionary[value][index_kind]
-                new_sites.append(dict_site)
-            return new_sites
+            # convert each property to a list only once, then zip them site by site.
+            columns = {
+                key: value.tolist() if isinstance(value, np.ndarray) else value
+                for key, value in kinds_dictionary.items()
+                if key != "index"
+            }
+            return [dict(zip(columns, site_values)) for site_values in zip(*columns.values())]
 
         return kinds_dictionary
 
@@ -645,13 +700,22 @@ class GetterMixin:
 
         Raises:
             ValueError: should provide a filename different from None.
-        """
-        if not has_ase:
-            raise ImportError("The ASE package cannot be imported.")
 
+        .. note:: periodic structures are written in the CIF format directly via pymatgen, if available,
+            without going through the ASE Atoms object. As in the ASE writer, the charges are not written.
+        """
         if not filename:
             raise ValueError("Please provide a valid filename.")
 
+        if format == "cif" and has_pymatgen and any(self.properties.pbc):
+            pymatgen_structure = self.to_pymatgen()
+            pymatgen_structure.remove_oxidation_states()
+            CifWriter(pymatgen_structure).write_file(filename)
+            return
+
+        if not has_ase:
+            raise ImportError("The ASE package cannot be imported.")
+
         aseatoms = self.to_ase()
         ase_io.write(filename, aseatoms, format=format)
 
@@ -705,8 +769,6 @@ class GetterMixin:
 
     def _validate(self):
         """Performs some standard validation tests."""
-        from aiida.common.exceptions import ValidationError
-
         super()._validate()
 
         try:
@@ -721,38 +783,7 @@ class GetterMixin:
 
         self._validate_dimensionality()
 
-        try:
-            # This will try to create the kinds objects
-            kinds = set(self.get_site_property("kind_name"))
-        except ValueError as exc:
-            raise ValidationError(f"Unable to validate the kinds: {exc}")
-
-        from collections import Counter
-
-        counts = Counter([k for k in kinds])
-        for count in counts:
-            if counts[count] != 1:
-                raise ValidationError(
-                    f"Kind with name '{count}' appears {counts[count]} times instead of only one"
-                )
-
-        try:
-            # This will try to create the sites objects
-            sites = self.properties.sites
-        except ValueError as exc:
-            raise ValidationError(f"Unable to validate the sites: {exc}")
-
-        for site in sites:
-            if site.kind_name not in kinds:
-                raise ValidationError(
-                    f"A site has kind {site.kind_name}, but no specie with that name exists"
-                )
-
-        kinds_without_sites = {k for k in kinds} - {s.kind_name for s in sites}
-        if kinds_without_sites:
-            raise ValidationError(
-                f"The following kinds are defined, but there are no sites with that kind: {list(kinds_without_sites)}"
-            )
+        # The sites (and so their kind names) are already validated when the properties model is built.
 
     def _prepare_xsf(self, main_file_name=""):
         """Write the given structure to a string of format XSF (for XCrySDen)."""
@@ -761,41 +792,41 @@ class GetterMixin:
                 "XSF for alloys or systems with vacancies not implemented."
             )
 
-        sites = self.properties.sites
-
-        return_string = "CRYSTAL\nPRIMVEC 1\n"
-        for cell_vector in self.properties.cell:
-            return_string += " ".join([f"{i:18.10f}" for i in cell_vector])
-            return_string += "\n"
-        return_string += "PRIMCOORD 1\n"
-        return_string += f"{int(len(sites))} 1\n"
-        for site in sites:
-            # I checked above that it is not an alloy, therefore I take the
-            # first symbol
-            return_string += (
-                f"{_atomic_numbers[self.get_kind(site.kind_name).symbols[0]]} "
-            )
-            return_string += "%18.10f %18.10f %18.10f\n" % tuple(site.position)
-        return return_string.encode("utf-8"), {}
+        # I checked above that it is not an alloy, therefore the symbol is a single element
+        symbols = self.get_site_property("symbol")
+        positions = self.get_site_property("position")
+
+        return_string = io.StringIO()
+        return_string.write("CRYSTAL\nPRIMVEC 1\n")
+        np.savetxt(return_string, self.properties.get_cell_array(), fmt="%18.10f")
+        return_string.write("PRIMCOORD 1\n")
+        return_string.write(f"{len(symbols)} 1\n")
+        np.savetxt(
+            return_string,
+            np.column_stack([atomic_numbers_for(symbols), positions]),
+            fmt="%d %18.10f %18.10f %18.10f",
+        )
+        return return_string.getvalue().encode("utf-8"), {}
 
     def _prepare_cif(self, main_file_name=""):
         """Write the given structure to a string of format CIF."""
-        from aiida.orm import CifData
-
-        cif = CifData(ase=self.to_ase())
+        cif = orm.CifData(ase=self.to_ase())
         return cif._prepare_cif()
 
     def _prepare_chemdoodle(self, main_file_name=""):
         """Write the given structure to a string of format required by ChemDoodle."""
-        from itertools import product
-
-        import numpy as np
-
         supercell_factors = [1, 1, 1]
 
         # Get cell vectors and atomic position
-        lattice_vectors = np.array(self.base.attributes.get("cell"))
-        base_sites = self.base.attributes.get("sites")
+        lattice_vectors = self.properties.get_cell_array()
+        base_sites = self.properties.sites
+
+        # the symbols string only depends on the species and weights of the site: compute it only once for each of them.
+        # The kind name is not used as key, since it is not tied to the species of the site.
+        kind_strings = {
+            (site.symbol, tuple(site.weights)): get_symbols_string(site.alloy_list, site.weights)
+            for site in base_sites
+        }
 
         start1 = -int(supercell_factors[0] / 2)
         start2 = -int(supercell_factors[1] / 2)
@@ -809,32 +840,33 @@ class GetterMixin:
         grid2 = range(start2, stop2)
         grid3 = range(start3, stop3)
 
-        atoms_json = []
-
         # Manual recenter of the structure
         center = (lattice_vectors[0] + lattice_vectors[1] + lattice_vectors[2]) / 2.0
 
-        for ix, iy, iz in product(grid1, grid2, grid3):
-            for base_site in base_sites:
-                shift = (
-                    ix * lattice_vectors[0]
-                    + iy * lattice_vectors[1]
-                    + iz * lattice_vectors[2]
-                    - center
-                ).tolist()
-
-                kind_name = base_site["kind_name"]
-                kind_string = self.get_kind(kind_name).get_symbols_string()
-
-                atoms_json.append(
-                    {
-                        "l": kind_string,
-                        "x": base_site["position"][0] + shift[0],
-                        "y": base_site["position"][1] + shift[1],
-                        "z": base_site["position"][2] + shift[2],
-                        "atomic_elements_html": atom_kinds_to_html(kind_string),
-                    }
-                )
+        # shifts of all the replicas, shape (G, 3), and positions of all the atoms, shape (G * S, 3)
+        grid = np.array(list(product(grid1, grid2, grid3)), dtype=float)
+        shifts = (
+            grid[:, 0, None] * lattice_vectors[0]
+            + grid[:, 1, None] * lattice_vectors[1]
+            + grid[:, 2, None] * lattice_vectors[2]
+            - center
+        )
+        base_positions = self.get_site_property("position")
+        all_positions = (base_positions[None, :, :] + shifts[:, None, :]).reshape(-1, 3)
+
+        labels = [kind_strings[(base_site.symbol, tuple(base_site.weights))] for base_site in base_sites] * len(grid)
+        html_labels = {kind_string: atom_kinds_to_html(kind_string) for kind_string in kind_strings.values()}
+
+        atoms_json = [
+            {
+                "l": kind_string,
+                "x": x,
+                "y": y,
+                "z": z,
+                "atomic_elements_html": html_labels[kind_string],
+            }
+            for kind_string, (x, y, z) in zip(labels, all_positions.tolist())
+        ]
 
         cell_json = {
             "t": "UnitCell",
@@ -853,7 +885,7 @@ class GetterMixin:
 
         return_dict = {"s": [cell_json], "m": [{"a": atoms_json}], "units": "&Aring;"}
 
-        return json.dumps(return_dict).encode("utf-8"), {}
+        return json.dumps(return_dict, separators=(",", ":")).encode("utf-8"), {}
 
     def _prepare_xyz(self, main_file_name=""):
         """Write the given structure to a string of format XYZ."""
@@ -862,10 +894,11 @@ class GetterMixin:
                 "XYZ for alloys or systems with vacancies not implemented."
             )
 
-        sites = self.properties.sites
+        symbols = self.get_site_property("symbol")
+        positions = self.get_site_property("position")
         cell = self.properties.cell
 
-        return_list = [f"{len(sites)}"]
+        return_list = [f"{len(symbols)}"]
         return_list.append(
             'Lattice="{} {} {} {} {} {} {} {} {}" pbc="{} {} {}"'.format(
                 cell[0][0],
@@ -882,17 +915,15 @@ class GetterMixin:
                 self.properties.pbc[2],
             )
         )
-        for site in sites:
-            # I checked above that it is not an alloy, therefore I take the
-            # first symbol
-            return_list.append(
-                "{:6s} {:18.10f} {:18.10f} {:18.10f}".format(
-                    self.get_kind(site.kind_name).symbols[0],
-                    site.position[0],
-                    site.position[1],
-                    site.position[2],
-                )
-            )
+        if len(symbols) > 0:
+            # I checked above that it is not an alloy, therefore the symbol is a single element.
+            # All the site lines are formatted in a single pass.
+            rows = np.empty((len(symbols), 4), dtype=object)
+            rows[:, 0] = symbols
+            rows[:, 1:] = positions
+            sites_block = io.StringIO()
+            np.savetxt(sites_block, rows, fmt="%-6s %18.10f %18.10f %18.10f")
+            return_list.append(sites_block.getvalue().rstrip("\n"))
 
         return_string = "\n".join(return_list)
         return return_string.encode("utf-8"), {}
@@ -921,33 +952,18 @@ class GetterMixin:
         """If the structure was imported from an xyz file, it lacks a cell.
         This method will adjust the cell
         """
-        import numpy as np
-
-        def get_extremas_from_positions(positions):
-            """Returns the minimum and maximum value for each dimension in the positions given"""
-            return list(
-                zip(*[(min(values), max(values)) for values in zip(*positions)])
-            )
-
         # Calculating the minimal cell:
-        positions = np.array([site.position for site in self.properties.sites])
-        position_min, _ = get_extremas_from_positions(positions)
+        positions = np.array(self.get_site_property("position"), dtype=float)
 
         # Translate the structure to the origin, such that the minimal values in each dimension
         # amount to (0,0,0)
-        positions -= position_min
-        for index, site in enumerate(self.base.attributes.get("sites")):
-            site["position"] = list(positions[index])
+        positions -= positions.min(axis=0)
+        for site, position in zip(self.properties.sites, positions.tolist()):
+            site.position = position
 
         # The orthorhombic cell that (just) accomodates the whole structure is now given by the
         # extremas of position in each dimension:
-        minimal_orthorhombic_cell_dimensions = np.array(
-            get_extremas_from_positions(positions)[1]
-        )
-        minimal_orthorhombic_cell_dimensions = np.dot(
-            vacuum_factor, minimal_orthorhombic_cell_dimensions
-        )
-        minimal_orthorhombic_cell_dimensions += vacuum_addition
+        minimal_orthorhombic_cell_dimensions = positions.max(axis=0) * vacuum_factor + vacuum_addition
 
         # Transform the vector (a, b, c ) to [[a,0,0], [0,b,0], [0,0,c]]
         newcell = np.diag(minimal_orthorhombic_cell_dimensions)
@@ -979,16 +995,29 @@ class GetterMixin:
 
         :return: an ase.Atoms object
         """
-        import ase
-
-        asecell = ase.Atoms(cell=self.properties.cell, pbc=self.properties.pbc)
-
-        for site in self.properties.sites:
-            asecell.append(site.to_ase(kinds=site.kind_name))
-
-        # asecell.set_initial_charges(self.get_site_property("charge"))
-
-        return asecell
+        if self.is_alloy or self.has_vacancies:
+            raise ValueError("Cannot convert to ASE a structure with alloys or vacancies.")
+
+        site_arrays = self.properties.get_site_arrays(["symbol", "kind_name", "position", "mass", "charge", "magmom"])
+        symbols = site_arrays["symbol"].tolist()
+
+        # the tag is the (integer) suffix of the kind name with respect to the symbol, as in `Site.to_ase`
+        tags = []
+        for symbol, kind_name in zip(symbols, site_arrays["kind_name"].tolist()):
+            tag = kind_name.replace(symbol, "")
+            tags.append(int(tag) if len(tag) > 0 else 0)
+
+        # all the sites are set at once, instead of appending an ase.Atom per site
+        return ase.Atoms(
+            symbols=symbols,
+            positions=site_arrays["position"],
+            masses=site_arrays["mass"],
+            charges=site_arrays["charge"],
+            magmoms=site_arrays["magmom"],
+            tags=tags,
+            cell=self.properties.cell,
+            pbc=self.properties.pbc,
+        )
 
     def _get_object_pymatgen(self, **kwargs):
         """Converts
@@ -1029,14 +1058,11 @@ class GetterMixin:
         .. note:: Requires the pymatgen module (version >= 3.0.13, usage
             of earlier versions may cause errors)
         """
-        from pymatgen.core.lattice import Lattice
-        from pymatgen.core.periodic_table import Specie
-        from pymatgen.core.structure import Structure
-
         species = []
         additional_kwargs = {}
 
-        lattice = Lattice(matrix=self.properties.cell, pbc=self.properties.pbc)
+        lattice = core.Lattice(matrix=self.properties.cell, pbc=self.properties.pbc)
+        sites = self.properties.sites
 
         if kwargs.pop("add_spin", False) and any(
             n.endswith("1") or n.endswith("2") for n in self.get_kind_names()
@@ -1044,11 +1070,8 @@ class GetterMixin:
             # case when spins are defined -> no partial occupancy allowed
 
             oxidation_state = 0  # now I always set the oxidation_state to zero
-            for site in self.properties.sites:
-                kind = site.kind_name
-                if len(kind.symbols) != 1 or (
-                    len(kind.weights) != 1 or sum(kind.weights) < 1.0
-                ):
+            for site in sites:
+                if site.is_alloy or site.has_vacancies:
                     raise ValueError(
                         "Cannot set partial occupancies and spins at the same time"
                     )
@@ -1060,25 +1083,19 @@ class GetterMixin:
                     else 0
                 )
                 try:
-                    specie = Specie(
-                        kind.symbols[0], oxidation_state, properties={"spin": spin}
+                    specie = core.periodic_table.Specie(
+                        site.symbol, oxidation_state, properties={"spin": spin}
                     )
                 except TypeError:
                     # As of v2023.9.2, the ``properties`` argument is removed and the ``spin`` argument should be used.
                     # See: https://github.com/materialsproject/pymatgen/commit/118c245d6082fe0b13e19d348fc1db9c0d512019
                     # The ``spin`` argument was introduced in v2023.6.28.
                     # See: https://github.com/materialsproject/pymatgen/commit/9f2b3939af45d5129e0778d371d814811924aeb6
-                    specie = Specie(kind.symbols[0], oxidation_state, spin=spin)
+                    specie = core.periodic_table.Specie(site.symbol, oxidation_state, spin=spin)
                 species.append(specie)
         else:
             # case when no spin are defined
-            for site in self.properties.sites:
-                kind = site.kind_name
-                specie = Specie(
-                    site.symbol,
-                    site.charge,
-                )  # spin)
-                species.append(specie)
+            species = [core.periodic_table.Specie(site.symbol, site.charge) for site in sites]
             # if any(
             #    create_automatic_kind_name(self.get_kind(name).symbols, self.get_kind(name).weights) != name
             #    for name in self.get_site_property("kind_name")
@@ -1096,13 +1113,11 @@ class GetterMixin:
                 f"Unrecognized parameters passed to pymatgen converter: {kwargs.keys()}"
             )
 
-        positions = [list(x.position) for x in self.properties.sites]
-
         try:
-            return Structure(
+            return core.Structure(
                 lattice,
                 species,
-                positions,
+                self.get_site_property("position"),
                 coords_are_cartesian=True,
                 **additional_kwargs,
             )
@@ -1123,32 +1138,22 @@ class GetterMixin:
         .. note:: Requires the pymatgen module (version >= 3.0.13, usage
             of earlier versions may cause errors)
         """
-        from pymatgen.core.structure import Molecule
-
         if kwargs:
             raise ValueError(
                 f"Unrecognized parameters passed to pymatgen converter: {kwargs.keys()}"
             )
 
-        species = []
-        for site in self.properties.sites:
-            if hasattr(site, "weight"):
-                weight = site.weight
-            else:
-                weight = 1
-            species.append({site.symbol: weight})
+        species = [dict(zip(site.alloy_list, site.weights)) for site in self.properties.sites]
 
-        positions = [list(site.position) for site in self.properties.sites]
-        mol =  Molecule(species, positions)
-
-        additional_kwargs["site_properties"] = {
+        return core.Molecule(
+            species,
+            self.get_site_property("position"),
+            site_properties={
                 "kind_name": self.properties.kinds,
                 "charge": self.properties.charges,
-                "magmom": self.properties.magmoms
-            }
-
-        for prop,value in additional_kwargs.items():
-            mol.add_site_property(prop, value)
+                "magmom": self.properties.magmoms,
+            },
+        )
 
     def _get_dimensionality(
         self,
@@ -1160,33 +1165,7 @@ class GetterMixin:
         :return: returns a dictionary with keys "dim" (dimensionality integer), "label" (dimensionality label)
             and "value" (numerical length/surface/volume).
         """
-        import numpy as np
-
-        retdict = {}
-
-        pbc = np.array(self.properties.pbc)
-        cell = np.array(self.properties.cell)
-
-        dim = len(pbc[pbc])
-
-        retdict["dim"] = dim
-        retdict["label"] = self._dimensionality_label[dim]
-
-        if dim not in (0, 1, 2, 3):
-            raise ValueError(f"Dimensionality {dim} must be one of 0, 1, 2, 3")
-
-        if dim == 0:
-            # We have no concept of 0d volume. Let's return a value of 0 for a consistent output dictionary
-            retdict["value"] = 0
-        elif dim == 1:
-            retdict["value"] = np.linalg.norm(cell[pbc])
-        elif dim == 2:
-            vectors = cell[pbc]
-            retdict["value"] = np.linalg.norm(np.cross(vectors[0], vectors[1]))
-        elif dim == 3:
-            retdict["value"] = calc_cell_volume(cell)
-
-        return retdict
+        return get_dimensionality(self.properties.pbc, self.properties.get_cell_array())
 
     def _validate_dimensionality(
         self,
@@ -1221,8 +1200,9 @@ class GetterMixin:
         This methods allows to efficiently clusterize the point using the defined threshold.
 
         At the end, we reorder the kinds from zero (to have ordered list like Li0, Li1...).
-        Basically we define the set of unordered kinds, and the range(len(set(kinds))) being the group of orderd kinds.
-        Then we basically do a mapping with the np.where().
+        This is done in a single pass, with a scatter-reduce (`np.minimum.at`) over the indexes when they are
+        few small integers, or with `np.unique(indexes, axis=0, return_index=True, return_inverse=True)` otherwise:
+        each kind takes the property value of its first site.
 
         Args:
             thr (float, optional): the threshold to consider two atoms of the same element to be the same kind.
@@ -1235,59 +1215,52 @@ class GetterMixin:
                                 can be used in the matrix representation (the k.T).
             kinds_values: list of the associated property value to each kind detected.
         """
-        symbols_array = np.array(symbols)
-
-        if isinstance(self.get_site_property(property_name)[0], list) or isinstance(self.get_site_property(property_name)[0], np.ndarray):
-            #reference_array = np.array(self.get_site_property(property_name)[0]) # I take the difference to detect also the case [1,0,0] != [-1,0,0]
-            #prop_array = np.array([np.linalg.norm(row-reference_array) for row in self.get_site_property(property_name)])
-            prop_array = np.array(self.get_site_property(property_name))
-            shape_1 = len(prop_array[0])
-            kinds_values = np.zeros((len(symbols_array),shape_1))
-        else:
-            prop_array = np.array(self.get_site_property(property_name))
-            kinds_values = np.zeros(len(symbols_array))
+        prop_array = np.asarray(self.get_site_property(property_name))
 
         if thr == 0 or not thr:
             return np.array(range(len(prop_array))), prop_array
 
-        # list for the value of the property for each generated kind.
-
-        if isinstance(prop_array[0], np.ndarray):
+        if prop_array.ndim > 1:
             # here, to deal with set of 3D indexes and avoid to deal with directions of the vectors,
-            # I transform the set of indexes into string, so I can compared them in the np.where
-            indexes = np.array([np.array2string(np.array((row-prop_array[0])/ thr, dtype=int)) for row in prop_array])
+            # I take the indexes with respect to the first site, and then group the identical rows.
+            indexes = np.array((prop_array - prop_array[0]) / thr, dtype=int)
         else:
             indexes = np.array((prop_array - np.min(prop_array)) / thr, dtype=int)
 
-        # Here we select the closest value present in the property values
-        set_indexes = set(indexes)
-
-        for index in set_indexes:
-            where_index_in_indexes = np.where(indexes == index)[0]
-            kinds_values[where_index_in_indexes] = prop_array[where_index_in_indexes[0]]
-
+        # here we reorder from zero the kinds, and we select the value of the first site of each kind.
+        if indexes.ndim == 1 and indexes.max() < 4 * len(indexes):
+            # the indexes are few small non-negative integers: the first site of each index is found
+            # with a single scatter-reduce, without sorting.
+            first_site_of_index = np.full(indexes.max() + 1, len(indexes))
+            np.minimum.at(first_site_of_index, indexes, np.arange(len(indexes)))
+            present = first_site_of_index < len(indexes)
+            kinds_labels = (np.cumsum(present) - 1)[indexes]
+            first_sites = first_site_of_index[present]
+        else:
+            _, first_sites, kinds_labels = np.unique(indexes, axis=0, return_index=True, return_inverse=True)
+            kinds_labels = kinds_labels.reshape(-1)
 
-        # here we reorder from zero the kinds.
-        list_set_indexes = list(set_indexes)
-        kinds_labels = np.zeros(len(symbols_array), dtype=int)
-        for i in range(len(list_set_indexes)):
-            kinds_labels[np.where(indexes == list_set_indexes[i])[0]] = i
+        kinds_values = prop_array[first_sites[kinds_labels]].astype(float)
 
         return kinds_labels, kinds_values
 
     def __getitem__(self, index):
         "ENABLE SLICING. Return a sliced StructureData."
         # Handle slicing
-        sliced_structure_dict = self.to_dict()
         if isinstance(index, slice):
-            sliced_structure_dict["sites"] = sliced_structure_dict["sites"][index]
-            return self.__class__(**sliced_structure_dict)
+            sites = self.properties.sites[index]
         elif isinstance(index, int):
-            sliced_structure_dict["sites"] = [sliced_structure_dict["sites"][index]]
-            return self.__class__(**sliced_structure_dict)
+            sites = [self.properties.sites[index]]
         else:
             raise TypeError(f"Invalid argument type: {type(index)}")
 
+        # Only the selected sites are dumped, and the computed properties are not evaluated at all.
+        sliced_structure_dict = self.properties.model_dump(
+            exclude={"sites", *type(self.properties).model_computed_fields}
+        )
+        sliced_structure_dict["sites"] = [site.model_dump() for site in sites]
+        return self.__class__(**sliced_structure_dict)
+
     def __len__(
         self,
     ):
@@ -1374,11 +1347,11 @@ class SetterMixin:
 
         # check that the matrix is not singular. If it is, raise an error.
         # check to be done in the core.
-        for site_position in self.get_site_property("position"):
-            if (
-                np.linalg.norm(np.array(new_site.position) - np.array(site_position))
-                < 1e-3
-            ):
+        if len(self.properties.sites) > 0:
+            distances = np.linalg.norm(
+                self.get_site_property("position") - np.array(new_site.position), axis=1
+            )
+            if (distances < 1e-3).any():
                 raise ValueError(
                     "You cannot define two different sites to be in the same position!"
                 )
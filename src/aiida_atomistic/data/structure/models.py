@@ -2,7 +2,7 @@ import copy
 import functools
 import json
 import typing as t
-from pydantic import BaseModel, Field, field_validator, ConfigDict, computed_field, model_validator, field_serializer
+from pydantic import BaseModel, Field, field_validator, ConfigDict, computed_field, model_validator, field_serializer, PrivateAttr
 import numpy as np
 import warnings
 
@@ -10,7 +10,7 @@ from aiida import orm
 from aiida.common.constants import elements
 from aiida.orm.nodes.data import Data
 
-from aiida_atomistic.data.structure.site import SiteImmutable, SiteMutable
+from aiida_atomistic.data.structure.site import SiteCore, SiteImmutable, SiteMutable
 
 try:
     import ase  # noqa: F401
@@ -56,10 +56,62 @@ _SUM_THRESHOLD = 1.0e-6
 # Default cell
 _DEFAULT_CELL = [[0.0, 0.0, 0.0]] * 3
 
+# Computed fields which only collect the per-site values, already contained in the sites.
+_PER_SITE_COMPUTED_FIELDS = frozenset(("charges", "magmoms", "masses", "kinds", "symbols", "positions"))
+
 _valid_symbols = tuple(i["symbol"] for i in elements.values())
 _atomic_masses = {el["symbol"]: el["mass"] for el in elements.values()}
 _atomic_numbers = {data["symbol"]: num for num, data in elements.items()}
 
+# dtype and shape (of the value of each site) of the arrays of the core site properties
+_SITE_ARRAY_LAYOUT = {
+    "symbol": (str, ()),
+    "kind_name": (str, ()),
+    "position": (float, (3,)),
+    "mass": (float, ()),
+    "charge": (float, ()),
+    "magmom": (float, (3,)),
+}
+
+def _to_site_array(values, name=None):
+    """Convert the per-site values of a property into a numpy array.
+
+    The core site properties get a fixed dtype and shape, e.g. positions are always a (N, 3) array of floats,
+    also for a structure without sites.
+    Ragged values (e.g. the weights of sites with a different number of elements)
+    are stored in an array of objects.
+    """
+    try:
+        if name in _SITE_ARRAY_LAYOUT:
+            dtype, shape = _SITE_ARRAY_LAYOUT[name]
+            return np.array(values, dtype=dtype).reshape((len(values), *shape))
+        return np.array(values)
+    except (TypeError, ValueError):
+        array = np.empty(len(values), dtype=object)
+        for index, value in enumerate(values):
+            array[index] = value
+        return array
+
+class _ModelCache:
+    """Holder of the quantities cached on an immutable structure model.
+
+    It is kept in a private attribute, so it is not part of the state of the model and always compares equal.
+    Deep copies and unpickled instances get an empty cache; shallow copies (and so `model_copy`)
+    are given a new one by `StructureBaseModel.__copy__`.
+    """
+
+    def __init__(self):
+        self.cell_array = None
+        self.site_values = None
+        self.site_arrays = {}
+        self.site_lists = {}
+
+    def __eq__(self, other):
+        return isinstance(other, _ModelCache)
+
+    def __reduce__(self):
+        return (_ModelCache, ())
+
 class StructureBaseModel(BaseModel):
     """
     A base model representing a structure in atomistic simulations.
@@ -77,6 +129,8 @@ class StructureBaseModel(BaseModel):
     tot_magnetization: t.Optional[float] = Field(default  = None)
     custom: t.Optional[dict] = Field(default=None)
 
+    _cache: _ModelCache = PrivateAttr(default_factory=_ModelCache)
+
     class Config:
         from_attributes = True
         frozen = False
@@ -174,6 +228,94 @@ class StructureBaseModel(BaseModel):
             data["pbc"] = [True,True,True]
         return data
 
+    def __copy__(self):
+        """Return a shallow copy of the model, with an empty cache.
+
+        `model_copy` goes through this method, and its `update` may change the cell and the sites.
+        """
+        copied = super().__copy__()
+        copied.__pydantic_private__["_cache"] = _ModelCache()
+        return copied
+
+    def get_cell_array(self) -> np.ndarray:
+        """
+        Get the cell as a (3, 3) numpy array of floats.
+
+        For immutable structures the array is computed only once and is read-only.
+
+        Returns:
+            np.ndarray: The cell vectors, one per row.
+        """
+        if self._mutable:
+            return np.asarray(self.cell, dtype=float)
+        return self._frozen_cell_array
+
+    @property
+    def _frozen_cell_array(self) -> np.ndarray:
+        """The read-only cell array of an immutable structure."""
+        if self._cache.cell_array is None:
+            cell_array = np.array(self.cell, dtype=float)
+            cell_array.flags.writeable = False
+            self._cache.cell_array = cell_array
+        return self._cache.cell_array
+
+    def get_site_arrays(self, names: t.Optional[t.Iterable[str]] = None) -> dict:
+        """
+        Get the site properties as a struct of arrays, i.e. one numpy array per site property.
+
+        For immutable structures each array is computed only once, the first time it is requested,
+        and is read-only, as the sites cannot change.
+
+        Args:
+            names (Optional[Iterable[str]]): The site properties to return. Defaults to all of them.
+
+        Returns:
+            dict: The arrays of the site properties, keyed by the property name.
+        """
+        if self._mutable:
+            return self._build_site_arrays(names)
+
+        names = tuple(SiteCore.model_fields if names is None else names)
+        site_arrays = self._cache.site_arrays
+        for name in names:
+            if name not in site_arrays:
+                array = _to_site_array(self._frozen_site_values[name], name)
+                array.flags.writeable = False
+                site_arrays[name] = array
+        return {name: site_arrays[name] for name in names}
+
+    @property
+    def _frozen_site_values(self) -> dict:
+        """The per-site values of all the site properties of an immutable structure, collected in a single pass."""
+        if self._cache.site_values is None:
+            self._cache.site_values = self._collect_site_values()
+        return self._cache.site_values
+
+    def _collect_site_values(self, names: t.Optional[t.Iterable[str]] = None) -> dict:
+        """Collect the site properties in a single pass over the sites."""
+        site_columns = {name: [] for name in (SiteCore.model_fields if names is None else names)}
+        for site in self.sites:
+            for name, column in site_columns.items():
+                column.append(getattr(site, name))
+
+        return site_columns
+
+    def _build_site_arrays(self, names: t.Optional[t.Iterable[str]] = None) -> dict:
+        """Collect the site properties as numpy arrays."""
+        return {name: _to_site_array(column, name) for name, column in self._collect_site_values(names).items()}
+
+    def _get_site_list(self, name: str) -> FrozenList:
+        """Get the frozen list of the values of a site property, used by all the per-site computed fields.
+
+        For immutable structures the list is built only once and then shared.
+        """
+        if self._mutable:
+            return FrozenList(getattr(site, name) for site in self.sites)
+        site_lists = self._cache.site_lists
+        if name not in site_lists:
+            site_lists[name] = FrozenList(self._frozen_site_values[name])
+        return site_lists[name]
+
     @computed_field
     def cell_volume(self) -> float:
         """
@@ -182,7 +324,7 @@ class StructureBaseModel(BaseModel):
         Returns:
             float: The volume of the unit cell.
         """
-        return calc_cell_volume(self.cell)
+        return calc_cell_volume(self.get_cell_array())
 
     @computed_field
     def dimensionality(self) -> dict:
@@ -192,9 +334,9 @@ class StructureBaseModel(BaseModel):
         Returns:
             dict: A dictionary indicating the dimensionality of the structure.
         """
-        return get_dimensionality(self.pbc, self.cell)
+        return get_dimensionality(self.pbc, self.get_cell_array())
 
-    @computed_field
+    @computed_field(repr=False)
     def charges(self) -> FrozenList[float]:
         """
         Get the charges of the sites in the structure.
@@ -202,9 +344,9 @@ class StructureBaseModel(BaseModel):
         Returns:
             FrozenList[float]: The charges of the sites.
         """
-        return FrozenList([site.charge for site in self.sites])
+        return self._get_site_list("charge")
 
-    @computed_field
+    @computed_field(repr=False)
     def magmoms(self) -> FrozenList[FrozenList[float]]:
         """
         Get the magnetic moments of the sites in the structure.
@@ -212,9 +354,9 @@ class StructureBaseModel(BaseModel):
         Returns:
             FrozenList[FrozenList[float]]: The magnetic moments of the sites.
         """
-        return FrozenList([site.magmom for site in self.sites])
+        return self._get_site_list("magmom")
 
-    @computed_field
+    @computed_field(repr=False)
     def masses(self) -> FrozenList[float]:
         """
         Get the masses of the sites in the structure.
@@ -222,9 +364,9 @@ class StructureBaseModel(BaseModel):
         Returns:
             FrozenList[float]: The masses of the sites.
         """
-        return FrozenList([site.mass for site in self.sites])
+        return self._get_site_list("mass")
 
-    @computed_field
+    @computed_field(repr=False)
     def kinds(self) -> FrozenList[str]:
         """
         Get the kinds of the sites in the structure.
@@ -232,9 +374,9 @@ class StructureBaseModel(BaseModel):
         Returns:
             FrozenList[str]: The kinds of the sites.
         """
-        return FrozenList([site.kind_name for site in self.sites])
+        return self._get_site_list("kind_name")
 
-    @computed_field
+    @computed_field(repr=False)
     def symbols(self) -> FrozenList[str]:
         """
         Get the atomic symbols of the sites in the structure.
@@ -242,9 +384,9 @@ class StructureBaseModel(BaseModel):
         Returns:
             FrozenList[str]: The atomic symbols of the sites.
         """
-        return FrozenList([site.symbol for site in self.sites])
+        return self._get_site_list("symbol")
 
-    @computed_field
+    @computed_field(repr=False)
     def positions(self) -> FrozenList[FrozenList[float]]:
         """
         Get the positions of the sites in the structure.
@@ -252,7 +394,7 @@ class StructureBaseModel(BaseModel):
         Returns:
             FrozenList[FrozenList[float]]: The positions of the sites.
         """
-        return FrozenList([site.position for site in self.sites])
+        return self._get_site_list("position")
 
     @computed_field
     def formula(self) -> str:
@@ -183,11 +183,11 @@ class SiteCore(BaseModel):
 
         :param tag: optional tag to be appended to the kind name
         """
-        name_string = create_automatic_kind_name(self.symbol, self.weight)
+        name_string = create_automatic_kind_name(self.alloy_list, self.weights)
         if tag is None:
-            self.name = name_string
+            self.kind_name = name_string
         else:
-            self.name = f"{name_string}{tag}"
+            self.kind_name = f"{name_string}{tag}"
 
     def to_ase(self, kinds):
         """Return a ase.Atom object for this site.
@@ -207,6 +207,7 @@ class SiteCore(BaseModel):
         tag = None
         atom_dict = self.model_dump()
         atom_dict.pop("kind_name",None)
+        atom_dict.pop("weights",None)
         aseatom = ase.Atom(
             **atom_dict
         )
@@ -79,7 +79,10 @@ class StructureData(Data, GetterMixin):
     @property
     def properties(self):
         if self.is_stored:
-            return ImmutableStructureModel(**self.base.attributes.all)
+            # the attributes of a stored node cannot change anymore, so we validate them only once.
+            if getattr(self, "_stored_properties", None) is None:
+                self._stored_properties = ImmutableStructureModel(**self.base.attributes.all)
+            return self._stored_properties
         else:
             return self._properties
 
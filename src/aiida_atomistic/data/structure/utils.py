@@ -31,6 +31,13 @@ _valid_symbols = tuple(i["symbol"] for i in elements.values())
 _atomic_masses = {el["symbol"]: el["mass"] for el in elements.values()}
 _atomic_numbers = {data["symbol"]: num for num, data in elements.items()}
 _dimensionality_label = {0: '', 1: 'length', 2: 'surface', 3: 'volume'}
+# Maximum number of sites of the structures whose formula is cached
+_FORMULA_CACHE_MAX_SITES = 1000
+
+# Lookup tables to convert many symbols at once, via a single fancy-indexing gather.
+_MASSES = np.array([el["mass"] for el in elements.values()])
+_ATOMIC_NUMBERS = np.array(list(elements.keys()))
+_SYMBOL_TO_IDX = {symbol: index for index, symbol in enumerate(_valid_symbols)}
 
 class ObservedArray(np.ndarray):
     """
@@ -107,8 +114,9 @@ class FrozenList(list):
     """
     A subclass of list that represents an immutable list.
 
-    This class overrides the __setitem__ method to raise a ValueError
-    when attempting to modify the list.
+    This class overrides the __setitem__ method, and all the other in-place
+    modifiers of the list, to raise a ValueError when attempting to modify the list.
+    In this way, the same instance can be safely shared.
 
     Usage:
     >>> my_list = FrozenList([1, 2, 3])
@@ -116,9 +124,16 @@ class FrozenList(list):
     ValueError: This list is immutable
     """
 
-    def __setitem__(self, index, value):
+    def _immutable(self, *args, **kwargs):
         raise ValueError("This list is immutable")
 
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _immutable
+    append = extend = insert = pop = remove = clear = sort = reverse = _immutable
+
+    def __reduce_ex__(self, protocol):
+        # copy and pickle would otherwise rebuild the list by extending an empty one
+        return self.__class__, (list(self),)
+
 
 def _get_valid_cell(inputcell):
     """Return the cell in a valid format from a generic input.
@@ -170,14 +185,21 @@ def _get_valid_pbc(inputpbc):
 
 def _check_valid_sites(input_sites):
 
-    num_sites = len(input_sites)
+    # a single site cannot overlap with anything
+    if len(input_sites) < 2:
+        return
 
-    for i in range(num_sites):
-        for j in range(num_sites):
-            if j == i:
-                continue
-            if np.allclose(input_sites[i]["position"], input_sites[j]["position"], atol=1e-3):
-                raise ValueError(f"Sites {i+1} and {j+1} cannot have the same position")
+    # the sites can be given both as dictionaries and as site objects
+    positions = np.array(
+        [site["position"] if isinstance(site, dict) else site.position for site in input_sites], dtype=float
+    )
+
+    # each site is compared at once with all the following ones (the same as np.allclose on each pair).
+    for i in range(len(positions) - 1):
+        overlapping = np.isclose(positions[i], positions[i + 1 :], atol=1e-3).all(axis=1)
+        if overlapping.any():
+            j = i + 1 + int(np.argmax(overlapping))
+            raise ValueError(f"Sites {i+1} and {j+1} cannot have the same position")
 
     return
 
@@ -231,14 +253,12 @@ def get_dimensionality(
     :return: returns a dictionary with keys "dim" (dimensionality integer), "label" (dimensionality label)
         and "value" (numerical length/surface/volume).
     """
-    import numpy as np
-
     retdict = {}
 
-    pbc = np.array(pbc)
-    cell = np.array(cell)
+    pbc = np.asarray(pbc, dtype=bool)
+    cell = np.asarray(cell, dtype=np.float64)
 
-    dim = len(pbc[pbc])
+    dim = int(np.count_nonzero(pbc))
 
     retdict["dim"] = dim
     retdict["label"] = _dimensionality_label[dim]
@@ -252,8 +272,12 @@ def get_dimensionality(
     elif dim == 1:
         retdict["value"] = np.linalg.norm(cell[pbc])
     elif dim == 2:
-        vectors = cell[pbc]
-        retdict["value"] = np.linalg.norm(np.cross(vectors[0], vectors[1]))
+        # explicit cross product: np.cross and np.linalg.norm have a large overhead for a pair of 3-vectors
+        (x0, y0, z0), (x1, y1, z1) = cell[pbc].tolist()
+        cx = y0 * z1 - z0 * y1
+        cy = z0 * x1 - x0 * z1
+        cz = x0 * y1 - y0 * x1
+        retdict["value"] = (cx * cx + cy * cy + cz * cz) ** 0.5
     elif dim == 3:
         retdict["value"] = calc_cell_volume(cell)
 
@@ -378,7 +402,8 @@ def group_symbols(_list):
     :param _list: a list of elements representing a chemical formula
     :return: a list of length-2 lists of the form [ multiplicity , element ]
     """
-    the_list = copy.deepcopy(_list)
+    # the input may be immutable (e.g. a FrozenList), the working copy must be a plain list
+    the_list = copy.deepcopy(list(_list))
     the_list.reverse()
     grouped_list = [[1, the_list.pop()]]
     while the_list:
@@ -456,7 +481,7 @@ def get_formula_group(symbol_list, separator=""):
             ``group_together(['O','Ba','Ti','Ba','Ti'],2,1) =
                 ['O',['Ba','Ti'],['Ba','Ti']]``
         """
-        the_list = copy.deepcopy(_list)
+        the_list = copy.deepcopy(list(_list))
         the_list.reverse()
         grouped_list = []
         for _ in range(offset):
@@ -548,7 +573,7 @@ def get_formula_group(symbol_list, separator=""):
 def get_formula(symbol_list, mode="hill", separator=""):
     """Return a string with the chemical formula.
 
-    :param symbol_list: a list of symbols, e.g. ``['H','H','O']``
+    :param symbol_list: a list (or numpy array) of symbols, e.g. ``['H','H','O']``
     :param mode: a string to specify how to generate the formula, can
         assume one of the following values:
 
@@ -593,30 +618,48 @@ def get_formula(symbol_list, mode="hill", separator=""):
         initial order in which the atoms were appended by the user is
         used to group and/or order the symbols in the formula
     """
+    if isinstance(symbol_list, np.ndarray):
+        symbol_list = symbol_list.tolist()
+
+    # structures with the same composition are very common: the formula is cached, keyed on the symbols.
+    # Only small structures are cached, as the key holds all the symbols and building it costs as much as a site loop.
+    if len(symbol_list) <= _FORMULA_CACHE_MAX_SITES:
+        return _get_formula_cached(tuple(symbol_list), mode, separator)
+    return _get_formula(symbol_list, mode, separator)
+
+
+@functools.lru_cache(maxsize=256)
+def _get_formula_cached(symbols, mode, separator):
+    """Return the formula of a tuple of symbols, see ``get_formula``."""
+    return _get_formula(list(symbols), mode, separator)
+
+
+def _get_formula(symbol_list, mode, separator):
+    """Return the formula of a list of symbols, see ``get_formula``."""
     if mode == "group":
         return get_formula_group(symbol_list, separator=separator)
 
     # for hill and count cases, simply count the occurences of each
     # chemical symbol (with some re-ordering in hill)
-    if mode in ["hill", "hill_compact"]:
-        if "C" in symbol_list:
-            ordered_symbol_set = sorted(
-                set(symbol_list), key=lambda elem: {"C": "0", "H": "1"}.get(elem, elem)
+    if mode in ["hill", "hill_compact", "count", "count_compact"]:
+        # the unique symbols are sorted alphabetically
+        symbols, first_indexes, counts = np.unique(
+            np.array(symbol_list, dtype=str), return_index=True, return_counts=True
+        )
+        symbols = symbols.tolist()
+        counts = counts.tolist()
+
+        if mode not in ["hill", "hill_compact"]:
+            # keep the order of the atomic sites
+            order = np.argsort(first_indexes).tolist()
+        elif "C" in symbols:
+            order = sorted(
+                range(len(symbols)), key=lambda i: {"C": "0", "H": "1"}.get(symbols[i], symbols[i])
             )
         else:
-            ordered_symbol_set = sorted(set(symbol_list))
-        the_symbol_list = [
-            [symbol_list.count(elem), elem] for elem in ordered_symbol_set
-        ]
+            order = range(len(symbols))
 
-    elif mode in ["count", "count_compact"]:
-        ordered_symbol_indexes = sorted(
-            [symbol_list.index(elem) for elem in set(symbol_list)]
-        )
-        ordered_symbol_set = [symbol_list[i] for i in ordered_symbol_indexes]
-        the_symbol_list = [
-            [symbol_list.count(elem), elem] for elem in ordered_symbol_set
-        ]
+        the_symbol_list = [[counts[i], symbols[i]] for i in order]
 
     elif mode == "reduce":
         the_symbol_list = group_symbols(symbol_list)
@@ -683,14 +726,12 @@ def symop_ortho_from_fract(cell):
     """
     import math
 
-    import numpy
-
     a, b, c, alpha, beta, gamma = cell
     alpha, beta, gamma = (math.pi * x / 180 for x in [alpha, beta, gamma])
     ca, cb, cg = (math.cos(x) for x in [alpha, beta, gamma])
     sg = math.sin(gamma)
 
-    return numpy.array(
+    return np.array(
         [
             [a, b * cg, c * cb],
             [0, b * sg, c * (ca - cb * cg) / sg],
@@ -711,8 +752,6 @@ def symop_fract_from_ortho(cell):
     """
     import math
 
-    import numpy
-
     a, b, c, alpha, beta, gamma = cell
     alpha, beta, gamma = (math.pi * x / 180 for x in [alpha, beta, gamma])
     ca, cb, cg = (math.cos(x) for x in [alpha, beta, gamma])
@@ -720,7 +759,7 @@ def symop_fract_from_ortho(cell):
     ctg = cg / sg
     D = math.sqrt(sg * sg - cb * cb - ca * ca + 2 * ca * cb * cg)  # noqa: N806
 
-    return numpy.array(
+    return np.array(
         [
             [1.0 / a, -(1.0 / a) * ctg, (ca * cg - cb) / (a * D)],
             [0, 1.0 / (b * sg), -(ca - cb * cg) / (b * D * sg)],
@@ -826,6 +865,26 @@ def create_automatic_kind_name(symbols, weights):
         name_string += "X"
     return name_string
 
+def _symbols_to_indexes(symbols):
+    """Return the indexes of the given symbols in the lookup tables of the elements."""
+    return np.fromiter((_SYMBOL_TO_IDX[symbol] for symbol in symbols), dtype=np.int32, count=len(symbols))
+
+def masses_for(symbols):
+    """Return the atomic masses of the given chemical symbols.
+
+    :param symbols: a list (or numpy array) of chemical symbols.
+    :return: a numpy array of floats, with the same length as `symbols`.
+    """
+    return _MASSES[_symbols_to_indexes(symbols)]
+
+def atomic_numbers_for(symbols):
+    """Return the atomic numbers of the given chemical symbols.
+
+    :param symbols: a list (or numpy array) of chemical symbols.
+    :return: a numpy array of integers, with the same length as `symbols`.
+    """
+    return _ATOMIC_NUMBERS[_symbols_to_indexes(symbols)]
+
 def set_symbols_and_weights(new_data):
         """Set the chemical symbols and the weights for the site.
 
@@ -843,10 +902,8 @@ def set_symbols_and_weights(new_data):
 
         if not "mass" in new_data.keys() or np.isnan(new_data.get("mass", None)):
             # Weighted mass
-            w_sum = sum(weights_tuple)
-            normalized_weights = (i / w_sum for i in weights_tuple)
-            element_masses = (_atomic_masses[sym] for sym in symbols_tuple)
-            new_data["mass"] = sum(i * j for i, j in zip(normalized_weights, element_masses))
+            weights = np.array(weights_tuple)
+            new_data["mass"] = float(np.dot(weights / weights.sum(), masses_for(symbols_tuple)))
 
 def check_is_alloy(data):
     """Check if the data is an alloy or not.
@@ -854,10 +911,11 @@ def check_is_alloy(data):
     :param data: the data to check. The dict of the SiteCore model.
     :return: True if the data is an alloy, False otherwise.
     """
-    new_data = copy.deepcopy(data)
-    if len(new_data.get("weights", [1,])) == 1:
-        if new_data["symbol"] not in _valid_symbols:
-            raise ValueError(f'his is not a valid element: {new_data["symbol"]}')
+    if len(data.get("weights", [1,])) == 1:
+        if data["symbol"] not in _SYMBOL_TO_IDX:
+            raise ValueError(f'his is not a valid element: {data["symbol"]}')
         return None
+    # set_symbols_and_weights only replaces top-level keys, so a shallow copy is enough.
+    new_data = dict(data)
     set_symbols_and_weights(new_data)
     return new_data
@@ -56,6 +56,10 @@ def test_dict(example_structure_dict):
 
         returned_dict = structure.to_dict()
 
+        # the per-site computed properties are only returned on request
+        assert "charges" not in returned_dict
+        assert structure.to_dict(include_derived=True)["charges"] == structure.properties.charges
+
         for derived_property in structure.properties.model_computed_fields.keys():
             returned_dict.pop(derived_property, None)
         for property_to_delete in ["custom", "tot_charge", "tot_magnetization"]:
@@ -66,6 +70,17 @@ def test_dict(example_structure_dict):
         ), f"The dictionary returned by the method, {returned_dict}, \
                                                 is different from the initial one: {example_structure_dict}"
 
+        # the returned dictionary does not share any container with the structure
+        returned_dict["cell"][0][0] = 10.0
+        returned_dict["sites"][0]["position"][0] = 10.0
+        assert structure.properties.cell == example_structure_dict["cell"]
+        assert structure.properties.sites[0].position == example_structure_dict["sites"][0]["position"]
+
+    # also the custom values, which may be arbitrary objects
+    structure = StructureDataMutable(**example_structure_dict, custom={"array": np.zeros(3)})
+    structure.to_dict()["custom"]["array"][0] = 5.0
+    assert structure.properties.custom["array"].tolist() == [0.0, 0.0, 0.0]
+
 
 def test_structure_ASE_initialization():
     """
@@ -86,6 +101,26 @@ def test_structure_ASE_initialization():
 
         assert structure.properties.charges == [1]
         assert structure.properties.magmoms == [[0,0,1]]
+        # the weights are validated as floats, as in the dictionary of a site
+        assert isinstance(structure.properties.sites[0].weights[0], float)
+
+def test_to_ase():
+    """
+    Testing that the StructureData/StructureDataMutable is correctly converted into an ASE Atoms object.
+    """
+    atoms = bulk("NaCl", "rocksalt", a=5.64) * (2, 1, 1)
+    atoms.set_tags([0, 1, 0, 2])
+    atoms.set_initial_charges([1, -1, 1, -1])
+    for structure_type in [StructureDataMutable, StructureData]:
+        structure = structure_type.from_ase(atoms)
+
+        new_atoms = structure.to_ase()
+
+        assert new_atoms.get_chemical_symbols() == atoms.get_chemical_symbols()
+        assert new_atoms.get_tags().tolist() == [0, 1, 0, 2]
+        assert np.allclose(new_atoms.get_positions(), atoms.get_positions())
+        assert np.allclose(new_atoms.get_initial_charges(), atoms.get_initial_charges())
+        assert np.array_equal(new_atoms.cell.array, atoms.cell.array)
 
 def test_structure_Pymatgen_initialization():
     """
@@ -108,6 +143,94 @@ def test_structure_Pymatgen_initialization():
         assert structure.properties.charges == [1, 0]
         assert structure.properties.magmoms == [[0.0, 0.0, 0.0], [0.0, 0.0, 0.0]]
 
+    molecule = Molecule(["O", "H", "H"], [[0, 0, 0], [0.76, 0.59, 0], [-0.76, 0.59, 0]])
+
+    for structure_type in [StructureDataMutable, StructureData]:
+        structure = structure_type.from_pymatgen(molecule)
+
+        assert structure.properties.pbc == [False, False, False]
+        assert np.allclose(np.diag(structure.properties.cell), [11.52, 10.59, 10.0])
+
+def test_to_file(tmp_path):
+    """
+    Testing that the StructureData is correctly written to a CIF file.
+    """
+    from ase.io import read
+
+    atoms = bulk("NaCl", "rocksalt", a=5.64)
+    atoms.set_initial_charges([1.0, -1.0])
+    structure = StructureData.from_ase(atoms)
+
+    filename = tmp_path / "structure.cif"
+    structure.to_file(filename, format="cif")
+
+    # the charges are not written, independently of the CIF writer
+    assert "oxidation" not in filename.read_text()
+
+    read_atoms = read(filename)
+    assert read_atoms.get_chemical_symbols() == ["Na", "Cl"]
+    assert np.allclose(read_atoms.cell.cellpar(), atoms.cell.cellpar())
+    assert np.allclose(read_atoms.get_scaled_positions(), atoms.get_scaled_positions(wrap=True))
+
+def test_prepare_formats():
+    """
+    Testing that the StructureData/StructureDataMutable can be exported in the XSF, XYZ and ChemDoodle formats.
+    """
+    import json
+
+    atoms = bulk("NaCl", "rocksalt", a=5.64)
+    for structure_type in [StructureDataMutable, StructureData]:
+        structure = structure_type.from_ase(atoms)
+
+        xsf = structure._prepare_xsf()[0].decode().splitlines()
+        assert xsf[-2:] == [
+            "11       0.0000000000       0.0000000000       0.0000000000",
+            "17       2.8200000000       0.0000000000       0.0000000000",
+        ]
+
+        xyz = structure._prepare_xyz()[0].decode().splitlines()
+        assert xyz[0] == "2"
+        assert xyz[-1] == "Cl           2.8200000000       0.0000000000       0.0000000000"
+
+        chemdoodle = json.loads(structure._prepare_chemdoodle()[0])
+        assert [atom["l"] for atom in chemdoodle["m"][0]["a"]] == ["Na", "Cl"]
+
+    # the labels follow the species of the sites, also when they share the kind name
+    structure_dict = StructureDataMutable.from_ase(atoms).to_dict()
+    for site in structure_dict["sites"]:
+        site["kind_name"] = "X"
+    chemdoodle = json.loads(StructureDataMutable(**structure_dict)._prepare_chemdoodle()[0])
+    assert [atom["l"] for atom in chemdoodle["m"][0]["a"]] == ["Na", "Cl"]
+
+def test_to_pymatgen():
+    """
+    Testing that the StructureData is correctly converted into pymatgen Structure and Molecule objects.
+    """
+    from pymatgen.core import Molecule, Structure
+
+    structure = StructureData(
+        cell=[[3.0, 0.0, 0.0], [0.0, 3.0, 0.0], [0.0, 0.0, 3.0]],
+        sites=[
+            {"symbol": "Fe", "kind_name": "Fe1", "position": [0.0, 0.0, 0.0]},
+            {"symbol": "Fe", "kind_name": "Fe2", "position": [1.5, 1.5, 1.5]},
+        ],
+    )
+
+    pymatgen_structure = structure.to_pymatgen(add_spin=True)
+    assert isinstance(pymatgen_structure, Structure)
+    assert [site.specie.spin for site in pymatgen_structure] == [-1, 1]
+    assert np.allclose(pymatgen_structure.cart_coords, structure.get_positions())
+
+    molecule = StructureData(
+        pbc=[False, False, False],
+        cell=[[10.0, 0.0, 0.0], [0.0, 10.0, 0.0], [0.0, 0.0, 10.0]],
+        sites=[{"symbol": "O", "position": [0.0, 0.0, 0.0]}, {"symbol": "H", "position": [0.76, 0.59, 0.0]}],
+    )
+
+    pymatgen_molecule = molecule.to_pymatgen()
+    assert isinstance(pymatgen_molecule, Molecule)
+    assert pymatgen_molecule.site_properties["kind_name"] == ["O", "H"]
+
 def test_mutability():
     atoms = bulk("Cu", "fcc", a=3.6)
     # test StructureData
@@ -165,6 +288,126 @@ def test_mutability():
 
     assert np.array_equal(m.get_charges(), np.array([0,0]))
 
+def test_slicing():
+    atoms = bulk("NaCl", "rocksalt", a=5.64) * (2, 1, 1)
+    for structure_type in [StructureDataMutable, StructureData]:
+        structure = structure_type.from_ase(atoms)
+
+        sliced = structure[1:3]
+        assert isinstance(sliced, structure_type)
+        assert sliced.properties.symbols == ["Cl", "Na"]
+        assert sliced.properties.cell == structure.properties.cell
+        assert sliced.get_positions().tolist() == structure.get_positions()[1:3].tolist()
+
+        assert structure[-1].properties.sites == structure.properties.sites[-1:]
+
+def test_site_arrays(example_structure_dict):
+    for structure_type in [StructureDataMutable, StructureData]:
+        structure = structure_type(**example_structure_dict)
+
+        assert structure.get_site_property("position").shape == (1, 3)
+        assert structure.get_symbols().tolist() == ["Cu"]
+        assert structure.get_site_property("position").dtype == float
+
+    # the core site properties keep their shape also without sites
+    assert StructureDataMutable().get_site_property("position").shape == (0, 3)
+
+    # immutable structures compute the arrays only once, and they cannot be modified
+    structure = StructureData(**example_structure_dict)
+    assert structure.get_charges() is structure.get_charges()
+    with pytest.raises(ValueError):
+        structure.get_charges()[0] = 2.0
+
+    assert structure.properties.get_cell_array() is structure.properties.get_cell_array()
+    with pytest.raises(ValueError):
+        structure.properties.get_cell_array()[0, 0] = 2.0
+
+    # the same holds for the per-site computed fields, which cannot be modified in place
+    assert structure.properties.charges is structure.properties.charges
+    with pytest.raises(ValueError):
+        structure.properties.charges.append(2.0)
+
+def test_equality():
+    from aiida_atomistic.data.structure.models import ImmutableStructureModel
+
+    structure_dict = StructureDataMutable.from_ase(bulk("NaCl", "rocksalt", a=5.64)).to_dict()
+    models = [ImmutableStructureModel(**structure_dict) for _ in range(2)]
+
+    # the cached site arrays are not part of the state of the model
+    for model in models:
+        model.get_site_arrays()
+        assert model.symbols == ["Na", "Cl"]
+    assert models[0] == models[1]
+
+    # the same holds for the cell array, used by the computed fields of every dump
+    structures = [StructureData(**structure_dict) for _ in range(2)]
+    for structure in structures:
+        structure.to_dict()
+        structure.get_site_property("position")
+        assert structure.properties.get_cell_array().shape == (3, 3)
+    assert structures[0].properties == structures[1].properties
+
+def test_model_copy():
+    from aiida_atomistic.data.structure.models import ImmutableStructureModel
+
+    structure_dict = StructureDataMutable.from_ase(bulk("NaCl", "rocksalt", a=5.64)).to_dict()
+    model = ImmutableStructureModel(**structure_dict)
+    assert model.formula == "ClNa"
+    assert model.get_site_arrays(["symbol"])["symbol"].tolist() == ["Na", "Cl"]
+
+    # the copies do not share the cache of the original model
+    for deep in [False, True]:
+        copied = model.model_copy(
+            update={"sites": [SiteImmutable(symbol="O", position=[0.0, 0.0, 0.0])]}, deep=deep
+        )
+        assert copied.formula == "O"
+        assert copied.symbols == ["O"]
+        assert copied.get_site_arrays(["symbol"])["symbol"].tolist() == ["O"]
+    assert model.symbols == ["Na", "Cl"]
+
+    # the same holds for the cell
+    assert model.cell_volume == pytest.approx(5.64**3 / 4)
+    copied = model.model_copy(update={"cell": [[3.0, 0.0, 0.0], [0.0, 3.0, 0.0], [0.0, 0.0, 3.0]]})
+    assert copied.get_cell_array().tolist() == [[3.0, 0.0, 0.0], [0.0, 3.0, 0.0], [0.0, 0.0, 3.0]]
+    assert copied.cell_volume == pytest.approx(27.0)
+    assert copied.dimensionality["value"] == pytest.approx(27.0)
+
+def test_composition(example_structure_dict_alloy):
+    atoms = bulk("NaCl", "rocksalt", a=5.64) * (2, 1, 1)
+    for structure_type in [StructureDataMutable, StructureData]:
+        structure = structure_type.from_ase(atoms)
+
+        assert structure.get_composition() == {"Cl": 2, "Na": 2}
+        assert structure.get_composition(mode="reduced") == {"Cl": 1.0, "Na": 1.0}
+        assert structure.get_composition(mode="fractional") == {"Cl": 0.5, "Na": 0.5}
+
+        structure = structure_type(**example_structure_dict_alloy)
+
+        assert structure.get_composition() == {"{Al0.50Cu0.50}": 1}
+
+def test_formula_of_frozen_symbols():
+    from aiida_atomistic.data.structure.utils import FrozenList, get_formula_group, group_symbols
+
+    # the formula helpers work on the (immutable) symbols of the structure, without modifying them
+    structure = StructureData.from_ase(bulk("NaCl", "rocksalt", a=5.64))
+    assert group_symbols(structure.properties.symbols) == [[1, "Na"], [1, "Cl"]]
+    symbols = FrozenList(["Ba", "Ti", "O", "O", "O"])
+    assert group_symbols(symbols) == [[1, "Ba"], [1, "Ti"], [3, "O"]]
+    assert get_formula_group(symbols) == "BaTiO3"
+    assert symbols == ["Ba", "Ti", "O", "O", "O"]
+
+def test_stored_properties(example_structure_dict):
+    from aiida.orm import load_node
+
+    structure = StructureData(**example_structure_dict)
+    structure.store()
+
+    loaded = load_node(structure.pk)
+
+    assert loaded.properties is loaded.properties
+    assert loaded.properties.sites == structure.properties.sites
+    assert loaded.properties.cell == example_structure_dict["cell"]
+
 def test_computed_fields(example_structure_dict):
     for structure_type in [StructureDataMutable, StructureData]:
         structure = structure_type(**example_structure_dict)
@@ -173,6 +416,7 @@ def test_computed_fields(example_structure_dict):
         assert structure.properties.charges == [1.0]
         assert structure.properties.cell_volume == 11.664000000000001
         assert structure.properties.dimensionality == {'dim': 3, 'label': 'volume', 'value': 11.664000000000001}
+        assert structure._get_dimensionality() == structure.properties.dimensionality
 
         if isinstance(structure, StructureDataMutable):
             structure.add_atom(
@@ -188,6 +432,13 @@ def test_computed_fields(example_structure_dict):
             )
             assert structure.properties.charges == [0.0, 1.0]
 
+def test_cell_lengths_and_angles(example_structure_dict):
+    for structure_type in [StructureDataMutable, StructureData]:
+        structure = structure_type(**example_structure_dict)
+
+        assert np.allclose(structure.get_cell_lengths(), [1.8 * np.sqrt(2)] * 3)
+        assert np.allclose(structure.get_cell_angles(), [60.0] * 3)
+
 
 def test_model_validator(example_wrong_structure_dict,example_nomass_structure_dict):
     for structure_type in [StructureDataMutable, StructureData]:
@@ -201,6 +452,16 @@ def test_model_validator(example_wrong_structure_dict,example_nomass_structure_d
         assert structure.properties.masses == [63.546]
         assert structure.properties.sites[0].mass == 63.546
 
+    # the sites can also be given as site objects
+    from aiida_atomistic.data.structure.models import MutableStructureModel
+
+    model = MutableStructureModel(sites=[SiteMutable(symbol="H", position=[0.0, 0.0, 0.0])])
+    assert model.symbols == ["H"]
+    with pytest.raises(ValueError):
+        MutableStructureModel(
+            sites=[SiteMutable(symbol="H", position=[0.0, 0.0, 0.0]), SiteMutable(symbol="H", position=[0.0, 0.0, 0.0])]
+        )
+
 
 
 ## Test the get_kinds() method.
@@ -248,6 +509,17 @@ def test_get_kinds(example_structure_dict_for_kinds):
         assert new_structure.properties.kinds == ['Fe0', 'Fe1']
         assert new_structure.properties.magmoms == [[2.5, 0.1, 0.1], [2.4, 0.1, 0.1]]
 
+    # (2) equivalent sites are grouped in the same kind, numbered in order of appearance
+    atoms = bulk("Cu", "fcc", a=3.6) * (2, 2, 1)
+    atoms.set_initial_charges([0, 1, 0, 1])
+    for structure_type in [StructureData, StructureDataMutable]:
+        structure = structure_type.from_ase(atoms)
+
+        new_sites = structure.get_kinds(exclude=["weights"], ready_to_use=True)
+
+        assert [site["kind_name"] for site in new_sites] == ['Cu0', 'Cu1', 'Cu0', 'Cu1']
+        assert [site["position"] for site in new_sites] == structure.get_positions().tolist()
+
 def test_alloy(example_structure_dict_alloy):
 
     for structure_type in [StructureData, StructureDataMutable]:
@@ -255,3 +527,9 @@ def test_alloy(example_structure_dict_alloy):
 
         assert structure.properties.masses == [45.263768999999996]
         assert structure.properties.symbols == ["CuAl"]
+        assert structure.is_alloy
+        assert not structure.has_vacancies
+
+        if isinstance(structure, StructureDataMutable):
+            structure.properties.sites[0].set_automatic_kind_name(tag=1)
+            assert structure.properties.kinds == ["AlCu1"]